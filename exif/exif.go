@@ -10,7 +10,6 @@ import (
 	"errors"
 	"fmt"
 	"io"
-	"io/ioutil"
 	"math"
 	"strconv"
 	"strings"
@@ -246,7 +245,7 @@ func Decode(r io.Reader) (*Exif, error) {
 	// Put the header bytes back into the reader.
 	r = io.MultiReader(bytes.NewReader(header), r)
 	var (
-		er  *bytes.Reader
+		raw []byte
 		tif *tiff.Tiff
 		sec *appSec
 	)
@@ -268,7 +267,7 @@ func Decode(r io.Reader) (*Exif, error) {
 		b := &bytes.Buffer{}
 		tr := io.TeeReader(r, b)
 		tif, err = tiff.Decode(tr)
-		er = bytes.NewReader(b.Bytes())
+		raw = b.Bytes()
 	case assumeJPEG:
 		// Locate the JPEG APP1 header.
 		sec, err = newAppSec(jpeg_APP1, r)
@@ -276,26 +275,25 @@ func Decode(r io.Reader) (*Exif, error) {
 			return nil, err
 		}
 		// Strip away EXIF header.
-		er, err = sec.exifReader()
+		raw, err = sec.exifData()
 		if err != nil {
 			return nil, err
 		}
-		tif, err = tiff.Decode(er)
+		tif, err = tiff.Decode(bytes.NewReader(raw))
 	}
 
 	if err != nil {
 		return nil, decodeError{cause: err}
 	}
 
-	er.Seek(0, 0)
-	raw, err := ioutil.ReadAll(er)
-	if err != nil {
-		return nil, decodeError{cause: err}
+	// build an exif structure from the tiff; size the field index for the
+	// top-level IFDs up front so loading them doesn't repeatedly grow it.
+	nTags := 0
+	for _, d := range tif.Dirs {
+		nTags += len(d.Tags)
 	}
-
-	// build an exif structure from the tiff
 	x := &Exif{
-		main: map[FieldName]*tiff.Tag{},
+		main: make(map[FieldName]*tiff.Tag, nTags),
 		Tiff: tif,
 		Raw:  raw,
 	}
@@ -321,12 +319,12 @@ func Decode(r io.Reader) (*Exif, error) {
 // tag ID (in hex format).
 func (x *Exif) LoadTags(d *tiff.Dir, fieldMap map[uint16]FieldName, showMissing bool) {
 	for _, tag := range d.Tags {
-		name := fieldMap[tag.Id]
-		if name == "" {
+		name, ok := fieldMap[tag.Id]
+		if !ok {
 			if !showMissing {
 				continue
 			}
-			name = FieldName(fmt.Sprintf("%v%x", UnknownPrefix, tag.Id))
+			name = FieldName(UnknownPrefix + strconv.FormatUint(uint64(tag.Id), 16))
 		}
 		x.main[name] = tag
 	}
@@ -599,7 +597,7 @@ func newAppSec(marker byte, r io.Reader) (*appSec, error) {
 
 	// seek to marker
 	for dataLen == 0 {
-		if _, err := br.ReadBytes(0xFF); err != nil {
+		if err := skipPast(br, 0xFF); err != nil {
 			return nil, err
 		}
 		c, err := br.ReadByte()
@@ -609,39 +607,43 @@ func newAppSec(marker byte, r io.Reader) (*appSec, error) {
 			continue
 		}
 
-		dataLenBytes := make([]byte, 2)
-		for k, _ := range dataLenBytes {
-			c, err := br.ReadByte()
-			if err != nil {
-				return nil, err
-			}
-			dataLenBytes[k] = c
+		var dataLenBytes [2]byte
+		if _, err := io.ReadFull(br, dataLenBytes[:]); err != nil {
+			return nil, err
 		}
-		dataLen = int(binary.BigEndian.Uint16(dataLenBytes)) - 2
+		dataLen = int(binary.BigEndian.Uint16(dataLenBytes[:])) - 2
+	}
+	if dataLen < 0 {
+		return nil, errors.New("exif: invalid application section length")
 	}
 
-	// read section data
-	nread := 0
-	for nread < dataLen {
-		s := make([]byte, dataLen-nread)
-		n, err := br.Read(s)
-		nread += n
-		if err != nil && nread < dataLen {
-			return nil, err
-		}
-		app.data = append(app.data, s[:n]...)
+	// read exactly the section data and nothing after it
+	app.data = make([]byte, dataLen)
+	if _, err := io.ReadFull(br, app.data); err != nil {
+		return nil, err
 	}
 	return app, nil
 }
 
+// skipPast advances br past the next occurrence of delim without copying the
+// skipped bytes.
+func skipPast(br *bufio.Reader, delim byte) error {
+	for {
+		_, err := br.ReadSlice(delim)
+		if err != bufio.ErrBufferFull {
+			return err
+		}
+	}
+}
+
 // reader returns a reader on this appSec.
 func (app *appSec) reader() *bytes.Reader {
 	return bytes.NewReader(app.data)
 }
 
-// exifReader returns a reader on this appSec with the read cursor advanced to
-// the start of the exif's tiff encoded portion.
-func (app *appSec) exifReader() (*bytes.Reader, error) {
+// exifData returns the exif's tiff encoded portion of this appSec. The
+// returned slice shares app's backing array rather than copying it.
+func (app *appSec) exifData() ([]byte, error) {
 	if len(app.data) < 6 {
 		return nil, errors.New("exif: failed to find exif intro marker")
 	}
@@ -651,5 +653,5 @@ func (app *appSec) exifReader() (*bytes.Reader, error) {
 	if !bytes.Equal(exif, append([]byte("Exif"), 0x00, 0x00)) {
 		return nil, errors.New("exif: failed to find exif intro marker")
 	}
-	return bytes.NewReader(app.data[6:]), nil
+	return app.data[6:], nil
 }
@@ -1,10 +1,14 @@
 package main
 
 import (
+	"bufio"
+	"bytes"
 	"flag"
 	"fmt"
+	"io"
 	"log"
 	"os"
+	"runtime"
 
 	"github.com/rwcarlsen/goexif/exif"
 	"github.com/rwcarlsen/goexif/mknote"
@@ -22,20 +26,13 @@ func main() {
 		exif.RegisterParsers(mknote.All...)
 	}
 
-	for _, name := range fnames {
-		f, err := os.Open(name)
-		if err != nil {
-			log.Printf("err on %v: %v", name, err)
-			continue
-		}
-
-		x, err := exif.Decode(f)
-		if err != nil {
-			log.Printf("err on %v: %v", name, err)
-			continue
-		}
-
-		if *thumb {
+	if *thumb {
+		for _, name := range fnames {
+			x, err := decodeFile(name)
+			if err != nil {
+				log.Printf("err on %v: %v", name, err)
+				continue
+			}
 			data, err := x.JpegThumbnail()
 			if err != nil {
 				log.Fatal("no thumbnail present")
@@ -45,16 +42,68 @@ func main() {
 			}
 			return
 		}
+		return
+	}
+
+	// Decode the files concurrently, one per CPU at a time. Each image's
+	// listing is built in its own buffer and written out in argument order.
+	type result struct {
+		listing []byte
+		err     error
+	}
+	results := make([]chan result, len(fnames))
+	sem := make(chan struct{}, runtime.NumCPU())
+	for i, name := range fnames {
+		results[i] = make(chan result, 1)
+		go func(name string, res chan<- result) {
+			sem <- struct{}{}
+			defer func() { <-sem }()
+			listing, err := describe(name)
+			res <- result{listing, err}
+		}(name, results[i])
+	}
+
+	out := bufio.NewWriter(os.Stdout)
+	for i, res := range results {
+		r := <-res
+		if r.err != nil {
+			log.Printf("err on %v: %v", fnames[i], r.err)
+			continue
+		}
+		out.Write(r.listing)
+		if err := out.Flush(); err != nil {
+			log.Fatal(err)
+		}
+	}
+}
 
-		fmt.Printf("\n---- Image '%v' ----\n", name)
-		x.Walk(Walker{})
+func decodeFile(name string) (*exif.Exif, error) {
+	f, err := os.Open(name)
+	if err != nil {
+		return nil, err
 	}
+	defer f.Close()
+	return exif.Decode(f)
 }
 
-type Walker struct{}
+// describe returns the formatted listing of all EXIF fields in the named file.
+func describe(name string) ([]byte, error) {
+	x, err := decodeFile(name)
+	if err != nil {
+		return nil, err
+	}
+	var buf bytes.Buffer
+	fmt.Fprintf(&buf, "\n---- Image '%v' ----\n", name)
+	x.Walk(Walker{&buf})
+	return buf.Bytes(), nil
+}
+
+type Walker struct {
+	w io.Writer
+}
 
-func (_ Walker) Walk(name exif.FieldName, tag *tiff.Tag) error {
+func (wk Walker) Walk(name exif.FieldName, tag *tiff.Tag) error {
 	data, _ := tag.MarshalJSON()
-	fmt.Printf("    %v: %v\n", name, string(data))
+	fmt.Fprintf(wk.w, "    %v: %s\n", name, data)
 	return nil
 }
@@ -6,7 +6,9 @@ import (
 	"errors"
 	"fmt"
 	"io"
+	"math"
 	"math/big"
+	"strconv"
 	"strings"
 	"unicode"
 	"unicode/utf8"
@@ -27,7 +29,7 @@ const (
 
 var ErrShortReadTagValue = errors.New("tiff: short read of tag value")
 
-var formatNames = map[Format]string{
+var formatNames = [...]string{
 	IntVal:    "int",
 	FloatVal:  "float",
 	RatVal:    "rational",
@@ -54,7 +56,7 @@ const (
 	DTDouble    DataType = 12
 )
 
-var typeNames = map[DataType]string{
+var typeNames = [...]string{
 	DTByte:      "byte",
 	DTAscii:     "ascii",
 	DTShort:     "short",
@@ -70,7 +72,7 @@ var typeNames = map[DataType]string{
 }
 
 // typeSize specifies the size in bytes of each type.
-var typeSize = map[DataType]uint32{
+var typeSize = [...]uint32{
 	DTByte:      1,
 	DTAscii:     1,
 	DTShort:     2,
@@ -85,6 +87,32 @@ var typeSize = map[DataType]uint32{
 	DTDouble:    8,
 }
 
+// typeFormat specifies the Format used to represent each type.
+var typeFormat = [...]Format{
+	0:           OtherVal,
+	DTByte:      IntVal,
+	DTAscii:     StringVal,
+	DTShort:     IntVal,
+	DTLong:      IntVal,
+	DTRational:  RatVal,
+	DTSByte:     IntVal,
+	DTUndefined: UndefVal,
+	DTSShort:    IntVal,
+	DTSLong:     IntVal,
+	DTSRational: RatVal,
+	DTFloat:     FloatVal,
+	DTDouble:    FloatVal,
+}
+
+// size returns the size in bytes of a single value of type dt, or zero for
+// unknown types.
+func (dt DataType) size() uint32 {
+	if int(dt) < len(typeSize) {
+		return typeSize[dt]
+	}
+	return 0
+}
+
 // Tag reflects the parsed content of a tiff IFD tag.
 type Tag struct {
 	// Id is the 2-byte tiff tag identifier.
@@ -104,8 +132,7 @@ type Tag struct {
 	order     binary.ByteOrder
 	intVals   []int64
 	floatVals []float64
-	ratVals   [][]int64
-	strVal    string
+	ratVals   [][2]int64
 	format    Format
 }
 
@@ -114,37 +141,45 @@ type Tag struct {
 // generally be relative to the beginning of the tiff structure (not relative
 // to the beginning of the tag).
 func DecodeTag(r ReadAtReader, order binary.ByteOrder) (*Tag, error) {
-	t := new(Tag)
-	t.order = order
-
-	err := binary.Read(r, order, &t.Id)
-	if err != nil {
-		return nil, errors.New("tiff: tag id read failed: " + err.Error())
+	// Read the whole 12-byte entry at once: 2-byte id, 2-byte type, 4-byte
+	// count and the 4-byte value/offset field.
+	var entry [12]byte
+	if _, err := io.ReadFull(r, entry[:]); err != nil {
+		return nil, errors.New("tiff: tag read failed: " + err.Error())
 	}
 
-	err = binary.Read(r, order, &t.Type)
-	if err != nil {
-		return nil, errors.New("tiff: tag type read failed: " + err.Error())
-	}
+	t := new(Tag)
+	return t, t.decodeEntry(entry[:], r, order)
+}
 
-	err = binary.Read(r, order, &t.Count)
-	if err != nil {
-		return nil, errors.New("tiff: tag component count read failed: " + err.Error())
-	}
+// decodeEntry fills t from the 12-byte IFD entry in entry. Values that don't
+// fit in the entry's offset field are read from r.
+func (t *Tag) decodeEntry(entry []byte, r io.ReaderAt, order binary.ByteOrder) error {
+	t.order = order
+	id, typ, count, off := entryFields(entry, order)
+	t.Id, t.Type, t.Count = id, DataType(typ), count
 
 	// There seems to be a relatively common corrupt tag which has a Count of
 	// MaxUint32. This is probably not a valid value, so return early.
 	if t.Count == 1<<32-1 {
-		return t, errors.New("invalid Count offset in tag")
+		return errors.New("invalid Count offset in tag")
 	}
 
-	valLen := typeSize[t.Type] * t.Count
+	// Compute the value length in 64 bits so a corrupt count can't wrap it
+	// around to something small.
+	valLen := uint64(t.Type.size()) * uint64(t.Count)
 	if valLen == 0 {
-		return t, errors.New("zero length tag value")
+		return errors.New("zero length tag value")
 	}
 
 	if valLen > 4 {
-		binary.Read(r, order, &t.ValOffset)
+		t.ValOffset = off
+
+		// Offsets are 32 bits wide, so a value extending past 4GiB can't be
+		// inside the tiff; reject it before reading anything.
+		if uint64(off)+valLen > 1<<32 {
+			return ErrShortReadTagValue
+		}
 
 		// Use a bytes.Buffer so we don't allocate a huge slice if the tag
 		// is corrupt.
@@ -152,166 +187,107 @@ func DecodeTag(r ReadAtReader, order binary.ByteOrder) (*Tag, error) {
 		sr := io.NewSectionReader(r, int64(t.ValOffset), int64(valLen))
 		n, err := io.Copy(&buff, sr)
 		if err != nil {
-			return t, errors.New("tiff: tag value read failed: " + err.Error())
+			return errors.New("tiff: tag value read failed: " + err.Error())
 		} else if n != int64(valLen) {
-			return t, ErrShortReadTagValue
+			return ErrShortReadTagValue
 		}
 		t.Val = buff.Bytes()
 
 	} else {
-		val := make([]byte, valLen)
-		if _, err = io.ReadFull(r, val); err != nil {
-			return t, errors.New("tiff: tag offset read failed: " + err.Error())
-		}
-		// ignore padding.
-		if _, err = io.ReadFull(r, make([]byte, 4-valLen)); err != nil {
-			return t, errors.New("tiff: tag offset read failed: " + err.Error())
-		}
-
-		t.Val = val
+		// the value fits in the offset field; ignore padding.
+		t.Val = make([]byte, valLen)
+		copy(t.Val, entry[8:])
 	}
 
-	return t, t.convertVals()
+	return t.convertVals()
+}
+
+// entryFields splits a 12-byte IFD entry into its id, type, count and
+// value/offset fields. The two standard byte orders are matched explicitly so
+// their methods can be inlined rather than called through the
+// binary.ByteOrder interface.
+func entryFields(entry []byte, order binary.ByteOrder) (id, typ uint16, count, off uint32) {
+	_ = entry[11] // bounds check hint to compiler
+	switch order {
+	case binary.LittleEndian:
+		le := binary.LittleEndian
+		return le.Uint16(entry[0:]), le.Uint16(entry[2:]), le.Uint32(entry[4:]), le.Uint32(entry[8:])
+	case binary.BigEndian:
+		be := binary.BigEndian
+		return be.Uint16(entry[0:]), be.Uint16(entry[2:]), be.Uint32(entry[4:]), be.Uint32(entry[8:])
+	}
+	return order.Uint16(entry[0:]), order.Uint16(entry[2:]), order.Uint32(entry[4:]), order.Uint32(entry[8:])
 }
 
 func (t *Tag) convertVals() error {
-	r := bytes.NewReader(t.Val)
+	if uint64(len(t.Val)) < uint64(t.Type.size())*uint64(t.Count) {
+		return ErrShortReadTagValue
+	}
 
+	// Numeric values are decoded straight out of t.Val; each element sits at
+	// a fixed offset so no intermediate reader is needed.
+	n := int(t.Count)
+	order, val := t.order, t.Val
 	switch t.Type {
-	case DTAscii:
-		if len(t.Val) <= 0 {
-			break
-		}
-		nullPos := bytes.IndexByte(t.Val, 0)
-		if nullPos == -1 {
-			t.strVal = string(t.Val)
-		} else {
-			// ignore all trailing NULL bytes, in case of a broken t.Count
-			t.strVal = string(t.Val[:nullPos])
-		}
 	case DTByte:
-		var v uint8
-		t.intVals = make([]int64, int(t.Count))
+		t.intVals = make([]int64, n)
 		for i := range t.intVals {
-			err := binary.Read(r, t.order, &v)
-			if err != nil {
-				return err
-			}
-			t.intVals[i] = int64(v)
+			t.intVals[i] = int64(val[i])
 		}
 	case DTShort:
-		var v uint16
-		t.intVals = make([]int64, int(t.Count))
+		t.intVals = make([]int64, n)
 		for i := range t.intVals {
-			err := binary.Read(r, t.order, &v)
-			if err != nil {
-				return err
-			}
-			t.intVals[i] = int64(v)
+			t.intVals[i] = int64(order.Uint16(val[2*i:]))
 		}
 	case DTLong:
-		var v uint32
-		t.intVals = make([]int64, int(t.Count))
+		t.intVals = make([]int64, n)
 		for i := range t.intVals {
-			err := binary.Read(r, t.order, &v)
-			if err != nil {
-				return err
-			}
-			t.intVals[i] = int64(v)
+			t.intVals[i] = int64(order.Uint32(val[4*i:]))
 		}
 	case DTSByte:
-		var v int8
-		t.intVals = make([]int64, int(t.Count))
+		t.intVals = make([]int64, n)
 		for i := range t.intVals {
-			err := binary.Read(r, t.order, &v)
-			if err != nil {
-				return err
-			}
-			t.intVals[i] = int64(v)
+			t.intVals[i] = int64(int8(val[i]))
 		}
 	case DTSShort:
-		var v int16
-		t.intVals = make([]int64, int(t.Count))
+		t.intVals = make([]int64, n)
 		for i := range t.intVals {
-			err := binary.Read(r, t.order, &v)
-			if err != nil {
-				return err
-			}
-			t.intVals[i] = int64(v)
+			t.intVals[i] = int64(int16(order.Uint16(val[2*i:])))
 		}
 	case DTSLong:
-		var v int32
-		t.intVals = make([]int64, int(t.Count))
+		t.intVals = make([]int64, n)
 		for i := range t.intVals {
-			err := binary.Read(r, t.order, &v)
-			if err != nil {
-				return err
-			}
-			t.intVals[i] = int64(v)
+			t.intVals[i] = int64(int32(order.Uint32(val[4*i:])))
 		}
 	case DTRational:
-		t.ratVals = make([][]int64, int(t.Count))
+		t.ratVals = make([][2]int64, n)
 		for i := range t.ratVals {
-			var n, d uint32
-			err := binary.Read(r, t.order, &n)
-			if err != nil {
-				return err
-			}
-			err = binary.Read(r, t.order, &d)
-			if err != nil {
-				return err
-			}
-			t.ratVals[i] = []int64{int64(n), int64(d)}
+			num := order.Uint32(val[8*i:])
+			den := order.Uint32(val[8*i+4:])
+			t.ratVals[i] = [2]int64{int64(num), int64(den)}
 		}
 	case DTSRational:
-		t.ratVals = make([][]int64, int(t.Count))
+		t.ratVals = make([][2]int64, n)
 		for i := range t.ratVals {
-			var n, d int32
-			err := binary.Read(r, t.order, &n)
-			if err != nil {
-				return err
-			}
-			err = binary.Read(r, t.order, &d)
-			if err != nil {
-				return err
-			}
-			t.ratVals[i] = []int64{int64(n), int64(d)}
+			num := int32(order.Uint32(val[8*i:]))
+			den := int32(order.Uint32(val[8*i+4:]))
+			t.ratVals[i] = [2]int64{int64(num), int64(den)}
 		}
 	case DTFloat: // float32
-		t.floatVals = make([]float64, int(t.Count))
+		t.floatVals = make([]float64, n)
 		for i := range t.floatVals {
-			var v float32
-			err := binary.Read(r, t.order, &v)
-			if err != nil {
-				return err
-			}
-			t.floatVals[i] = float64(v)
+			t.floatVals[i] = float64(math.Float32frombits(order.Uint32(val[4*i:])))
 		}
 	case DTDouble:
-		t.floatVals = make([]float64, int(t.Count))
+		t.floatVals = make([]float64, n)
 		for i := range t.floatVals {
-			var u float64
-			err := binary.Read(r, t.order, &u)
-			if err != nil {
-				return err
-			}
-			t.floatVals[i] = u
+			t.floatVals[i] = math.Float64frombits(order.Uint64(val[8*i:]))
 		}
 	}
 
-	switch t.Type {
-	case DTByte, DTShort, DTLong, DTSByte, DTSShort, DTSLong:
-		t.format = IntVal
-	case DTRational, DTSRational:
-		t.format = RatVal
-	case DTFloat, DTDouble:
-		t.format = FloatVal
-	case DTAscii:
-		t.format = StringVal
-	case DTUndefined:
-		t.format = UndefVal
-	default:
-		t.format = OtherVal
+	t.format = OtherVal
+	if int(t.Type) < len(typeFormat) {
+		t.format = typeFormat[t.Type]
 	}
 
 	return nil
@@ -322,7 +298,11 @@ func (t *Tag) convertVals() error {
 func (t *Tag) Format() Format { return t.format }
 
 func (t *Tag) typeErr(to Format) error {
-	return &wrongFmtErr{typeNames[t.Type], formatNames[to]}
+	var from string
+	if int(t.Type) < len(typeNames) {
+		from = typeNames[t.Type]
+	}
+	return &wrongFmtErr{from, formatNames[to]}
 }
 
 // Rat returns the tag's i'th value as a rational number. It returns a nil and
@@ -379,7 +359,13 @@ func (t *Tag) StringVal() (string, error) {
 	if t.format != StringVal {
 		return "", t.typeErr(StringVal)
 	}
-	return t.strVal, nil
+	// The string is built from Val on demand so that ascii tags nobody asks
+	// for are never copied.
+	if nullPos := bytes.IndexByte(t.Val, 0); nullPos != -1 {
+		// ignore all trailing NULL bytes, in case of a broken t.Count
+		return string(t.Val[:nullPos]), nil
+	}
+	return string(t.Val), nil
 }
 
 // String returns a nicely formatted version of the tag.
@@ -390,9 +376,9 @@ func (t *Tag) String() string {
 	}
 
 	if t.Count == 1 {
-		return strings.Trim(fmt.Sprintf("%s", data), "[]")
+		return strings.Trim(string(data), "[]")
 	}
-	return fmt.Sprintf("%s", data)
+	return string(data)
 }
 
 func (t *Tag) MarshalJSON() ([]byte, error) {
@@ -403,21 +389,30 @@ func (t *Tag) MarshalJSON() ([]byte, error) {
 		return []byte(fmt.Sprintf("unknown tag type '%v'", t.Type)), nil
 	}
 
-	rv := []string{}
+	// Format the values straight into the output buffer.
+	rv := make([]byte, 0, 2+8*int(t.Count))
+	rv = append(rv, '[')
 	for i := 0; i < int(t.Count); i++ {
+		if i > 0 {
+			rv = append(rv, ',')
+		}
 		switch t.format {
 		case RatVal:
 			n, d, _ := t.Rat2(i)
-			rv = append(rv, fmt.Sprintf(`"%v/%v"`, n, d))
+			rv = append(rv, '"')
+			rv = strconv.AppendInt(rv, n, 10)
+			rv = append(rv, '/')
+			rv = strconv.AppendInt(rv, d, 10)
+			rv = append(rv, '"')
 		case FloatVal:
 			v, _ := t.Float(i)
-			rv = append(rv, fmt.Sprintf("%v", v))
+			rv = strconv.AppendFloat(rv, v, 'g', -1, 64)
 		case IntVal:
-			v, _ := t.Int(i)
-			rv = append(rv, fmt.Sprintf("%v", v))
+			v, _ := t.Int64(i)
+			rv = strconv.AppendInt(rv, v, 10)
 		}
 	}
-	return []byte(fmt.Sprintf(`[%s]`, strings.Join(rv, ","))), nil
+	return append(rv, ']'), nil
 }
 
 func nullString(in []byte) []byte {
@@ -53,23 +53,28 @@ func Decode(r io.Reader) (*Tiff, error) {
 	}
 
 	// check for special tiff marker
-	var sp int16
-	err = binary.Read(buf, t.Order, &sp)
+	sp, err := readUint16(buf, t.Order)
 	if err != nil || 42 != sp {
 		return nil, errors.New("tiff: could not find special tiff marker")
 	}
 
 	// load offset to first IFD
-	var offset int32
-	err = binary.Read(buf, t.Order, &offset)
+	u, err := readUint32(buf, t.Order)
 	if err != nil {
 		return nil, errors.New("tiff: could not read offset to first IFD")
 	}
+	offset := int32(u)
 
-	// load IFD's
+	// load IFD's, remembering which offsets were already visited so a chain
+	// that loops back on itself is caught however long the loop is.
 	var d *Dir
-	prev := offset
+	seen := make(map[int32]bool)
 	for offset != 0 {
+		if seen[offset] {
+			return nil, errors.New("tiff: recursive IFD")
+		}
+		seen[offset] = true
+
 		// seek to offset
 		_, err := buf.Seek(int64(offset), 0)
 		if err != nil {
@@ -86,11 +91,6 @@ func Decode(r io.Reader) (*Tiff, error) {
 			return nil, err
 		}
 
-		if offset == prev {
-			return nil, errors.New("tiff: recursive IFD")
-		}
-		prev = offset
-
 		t.Dirs = append(t.Dirs, d)
 	}
 
@@ -120,28 +120,33 @@ func DecodeDir(r ReadAtReader, order binary.ByteOrder) (d *Dir, offset int32, er
 	d = new(Dir)
 
 	// get num of tags in ifd
-	var nTags int16
-	err = binary.Read(r, order, &nTags)
+	cnt, err := readUint16(r, order)
 	if err != nil {
 		return nil, 0, errors.New("tiff: failed to read IFD tag count: " + err.Error())
 	}
 
-	// load tags
-	for n := 0; n < int(nTags); n++ {
-		t, err := DecodeTag(r, order)
-		if err != nil {
+	// read the tag entries and the next-IFD offset that follows them up
+	// front, then walk the fixed-size entries in memory.
+	table := make([]byte, 12*int(cnt)+4)
+	if _, err := io.ReadFull(r, table[:12*int(cnt)]); err != nil {
+		return nil, 0, errors.New("tiff: tag read failed: " + err.Error())
+	}
+	if _, err := io.ReadFull(r, table[12*int(cnt):]); err != nil {
+		return nil, 0, errors.New("tiff: falied to read offset to next IFD: " + err.Error())
+	}
+
+	// load tags; they are allocated as one block rather than one at a time.
+	tags := make([]Tag, cnt)
+	d.Tags = make([]*Tag, cnt)
+	for i := range tags {
+		if err := tags[i].decodeEntry(table[12*i:12*i+12], r, order); err != nil {
 			return nil, 0, err
 		}
-		d.Tags = append(d.Tags, t)
+		d.Tags[i] = &tags[i]
 	}
 
 	// get offset to next ifd
-	err = binary.Read(r, order, &offset)
-	if err != nil {
-		return nil, 0, errors.New("tiff: falied to read offset to next IFD: " + err.Error())
-	}
-
-	return d, offset, nil
+	return d, int32(order.Uint32(table[12*int(cnt):])), nil
 }
 
 func (d *Dir) String() string {
@@ -151,3 +156,23 @@ func (d *Dir) String() string {
 	}
 	return s + "}"
 }
+
+// readUint16 reads a 2-byte unsigned integer from r in the given byte order.
+// It avoids the reflection and allocation overhead of binary.Read for the
+// many small fixed-size fields in IFDs.
+func readUint16(r io.Reader, order binary.ByteOrder) (uint16, error) {
+	var b [2]byte
+	if _, err := io.ReadFull(r, b[:]); err != nil {
+		return 0, err
+	}
+	return order.Uint16(b[:]), nil
+}
+
+// readUint32 reads a 4-byte unsigned integer from r in the given byte order.
+func readUint32(r io.Reader, order binary.ByteOrder) (uint32, error) {
+	var b [4]byte
+	if _, err := io.ReadFull(r, b[:]); err != nil {
+		return 0, err
+	}
+	return order.Uint32(b[:]), nil
+}
@@ -170,8 +170,8 @@ func testSingle(t *testing.T, order binary.ByteOrder, in input, out output, i in
 	}
 	if tg.Type == DTAscii && in.val != "" {
 		strOut := string(out.val)
-		if tg.strVal != strOut {
-			t.Errorf("(%v) tag %v string value decode: expected %q, got %q", order, i, strOut, tg.strVal)
+		if strVal, _ := tg.StringVal(); strVal != strOut {
+			t.Errorf("(%v) tag %v string value decode: expected %q, got %q", order, i, strOut, strVal)
 		}
 	} else {
 		if !bytes.Equal(tg.Val, out.val) {
@@ -247,3 +247,61 @@ func data() []byte {
 	}
 	return dat
 }
+
+func TestDecodeTagValues(t *testing.T) {
+	//   {"TgId", "TYPE", "N-VALUES", "OFFSET--", "VAL..."},
+	in := input{"0001", "0008", "00000003", "00000010", "FFFE00017FFF"}
+	tg, err := DecodeTag(bytes.NewReader(buildInput(in, binary.BigEndian)), binary.BigEndian)
+	if err != nil {
+		t.Fatalf("signed short decode failed: %v", err)
+	}
+	for i, want := range []int64{-2, 1, 32767} {
+		if got, _ := tg.Int64(i); got != want {
+			t.Errorf("signed short value %v: expected %v, got %v", i, want, got)
+		}
+	}
+
+	in = input{"0100", "0A00", "01000000", "10000000", "FDFFFFFF04000000"}
+	tg, err = DecodeTag(bytes.NewReader(buildInput(in, binary.LittleEndian)), binary.LittleEndian)
+	if err != nil {
+		t.Fatalf("signed rational decode failed: %v", err)
+	}
+	if n, d, _ := tg.Rat2(0); n != -3 || d != 4 {
+		t.Errorf("signed rational value: expected -3/4, got %v/%v", n, d)
+	}
+
+	in = input{"0001", "000B", "00000001", "3FC00000", ""}
+	tg, err = DecodeTag(bytes.NewReader(buildInput(in, binary.BigEndian)), binary.BigEndian)
+	if err != nil {
+		t.Fatalf("float decode failed: %v", err)
+	}
+	if v, _ := tg.Float(0); v != 1.5 {
+		t.Errorf("float value: expected 1.5, got %v", v)
+	}
+}
+
+func TestDecodeRecursiveIFD(t *testing.T) {
+	// IFD0 at offset 8 points to IFD1 at offset 26, which points back to IFD0.
+	s := "49492A0008000000"
+	s += "0100" + "000103000100000001000000" + "1A000000"
+	s += "0100" + "010103000100000001000000" + "08000000"
+	dat, err := hex.DecodeString(s)
+	if err != nil {
+		t.Fatal("invalid string fixture")
+	}
+
+	_, err = Decode(bytes.NewReader(dat))
+	if err == nil || err.Error() != "tiff: recursive IFD" {
+		t.Fatalf("expected recursive IFD error, got %v", err)
+	}
+}
+
+func TestDecodeTagCountOverflow(t *testing.T) {
+	// 0x40000001 longs would need 0x100000004 bytes, which wraps to 4 in 32
+	// bits.
+	in := input{"0001", "0004", "40000001", "00000010", ""}
+	_, err := DecodeTag(bytes.NewReader(buildInput(in, binary.BigEndian)), binary.BigEndian)
+	if err != ErrShortReadTagValue {
+		t.Fatalf("expected %v, got %v", ErrShortReadTagValue, err)
+	}
+}